@@ -0,0 +1,92 @@
+"""
+Shared pytest fixtures.
+A stand-in `ultralytics` module is installed so the YOLO integration and the API
+servers can be tested without model weights.
+"""
+
+import sys
+import threading
+import time
+import types
+
+import cv2
+import numpy as np
+import pytest
+
+
+class FakeTensor:
+    def __init__(self, values):
+        self.values = np.array(values, dtype=np.float32)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.values
+
+
+class FakeBox:
+    def __init__(self, class_id, confidence, xyxy):
+        self.cls = class_id
+        self.conf = confidence
+        self.xyxy = [FakeTensor(xyxy)]
+
+
+class FakeResult:
+    def __init__(self, boxes):
+        self.boxes = boxes
+
+
+class FakeYOLO:
+    """Records predict calls and returns one 'apple' per image"""
+
+    names = {0: 'apple', 1: 'banana'}
+
+    def __init__(self, model_path):
+        self.model_path = model_path
+        self.calls = []
+        self._busy = threading.Lock()
+
+    def predict(self, source, conf, iou, save, verbose):
+        # Ultralytics models are not thread-safe; fail loudly if one is shared
+        if not self._busy.acquire(blocking=False):
+            raise RuntimeError("model used from two threads at once")
+        try:
+            sources = list(source) if isinstance(source, list) else [source]
+            self.calls.append(sources)
+            time.sleep(0.01)
+            return [FakeResult([FakeBox(0, 0.9, [1.0, 2.0, 30.0, 40.0])]) for _ in sources]
+        finally:
+            self._busy.release()
+
+
+ultralytics = types.ModuleType('ultralytics')
+ultralytics.YOLO = FakeYOLO
+sys.modules['ultralytics'] = ultralytics
+
+
+def draw_photo(seed, width=320, height=240):
+    """Build a synthetic 'photo' of soft-edged shapes"""
+    rng = np.random.default_rng(seed)
+    photo = np.zeros((height, width, 3), dtype=np.uint8)
+    for _ in range(15):
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        cv2.circle(photo, center, int(rng.integers(10, 80)), color, -1)
+    return cv2.GaussianBlur(photo, (9, 9), 0)
+
+
+@pytest.fixture
+def write_photo(tmp_path):
+    """Write a synthetic photo for a seed and return its path"""
+    def write(name, seed):
+        path = str(tmp_path / f'{name}.png')
+        assert cv2.imwrite(path, draw_photo(seed))
+        return path
+    return write
+
+
+@pytest.fixture
+def sample_images(write_photo):
+    """Paths to two distinct photos plus an exact copy of the first"""
+    return {name: write_photo(name, seed) for name, seed in (('a', 1), ('a_copy', 1), ('b', 2))}
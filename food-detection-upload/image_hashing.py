@@ -0,0 +1,236 @@
+#!/usr/bin/env py
+"""
+Image Hashing Module
+Perceptual hashing (dHash) used to spot exact and near-duplicate uploads in a
+batch so the YOLO model only runs once per distinct photo, plus a content-digest
+index that lets byte-identical uploads in later requests skip inference.
+"""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+
+import cv2
+from PIL import Image
+
+# Width/height of the dHash grid (HASH_SIZE * HASH_SIZE bits)
+HASH_SIZE = 16
+
+# Hashes within this many differing bits (out of HASH_SIZE * HASH_SIZE) are
+# treated as the same photo when grouping images inside one batch
+DEFAULT_HASH_THRESHOLD = 4
+
+# Number of recent digests (and their detection results) kept across requests
+DEFAULT_INDEX_SIZE = 256
+
+# Seconds a cached detection result stays valid
+DEFAULT_INDEX_TTL = 600
+
+# A perceptual hash paired with the (width, height) of the source image
+Signature = Tuple[int, Tuple[int, int]]
+
+
+def dhash(image_path: str, hash_size: int = HASH_SIZE) -> Optional[int]:
+    """
+    Compute a difference hash (dHash) for an image
+
+    The image is decoded at 1/8 scale in grayscale, so the full-resolution
+    frame is never materialised. Images too small for the reduced decode
+    fall back to a full grayscale decode.
+
+    Args:
+        image_path: Path to the image file
+        hash_size: Width/height of the hash grid (hash_size * hash_size bits)
+
+    Returns:
+        The hash as an integer, or None if the image could not be decoded
+    """
+    try:
+        image = cv2.imread(image_path, cv2.IMREAD_REDUCED_GRAYSCALE_8)
+    except cv2.error:
+        # The reduced decode itself fails for images under 8 px on a side
+        image = None
+
+    try:
+        if image is None or min(image.shape[:2]) == 0:
+            image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if image is None or min(image.shape[:2]) == 0:
+            return None
+
+        resized = cv2.resize(image, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    except cv2.error:
+        return None
+
+    diff = resized[:, 1:] > resized[:, :-1]
+
+    value = 0
+    for bit in diff.flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def image_size(image_path: str) -> Optional[Tuple[int, int]]:
+    """Read an image's (width, height) from its header without decoding it"""
+    try:
+        with Image.open(image_path) as image:
+            return image.size
+    except (OSError, ValueError):
+        return None
+
+
+def image_digest(image_path: str) -> Optional[str]:
+    """
+    Compute a SHA-256 digest of an image file's bytes
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        The hex digest, or None if the file could not be read
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(image_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def image_signature(image_path: str) -> Optional[Signature]:
+    """
+    Compute the signature used to match duplicate images
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        (hash, (width, height)), or None if either could not be read
+    """
+    image_hash = dhash(image_path)
+    size = image_size(image_path)
+    if image_hash is None or size is None:
+        return None
+    return image_hash, size
+
+
+def hamming_distance(hash_a: int, hash_b: int) -> int:
+    """Number of differing bits between two hashes"""
+    return bin(hash_a ^ hash_b).count('1')
+
+
+def signatures_match(signature_a: Signature, signature_b: Signature, threshold: int = DEFAULT_HASH_THRESHOLD) -> bool:
+    """
+    Check whether two signatures belong to the same photo
+
+    Sizes must match exactly, since detections are in pixel coordinates.
+    """
+    hash_a, size_a = signature_a
+    hash_b, size_b = signature_b
+    return size_a == size_b and hamming_distance(hash_a, hash_b) <= threshold
+
+
+def group_duplicates(signatures: List[Optional[Signature]], threshold: int = DEFAULT_HASH_THRESHOLD) -> List[int]:
+    """
+    Collapse exact and near-duplicate images onto a representative
+
+    Args:
+        signatures: One signature per image (None for images that could not be hashed)
+        threshold: Maximum Hamming distance to treat two images as duplicates
+
+    Returns:
+        For each image, the index of the image whose inference result it should use
+        (its own index if it is the first of its group)
+    """
+    representatives = []
+    groups = []
+
+    for i, signature in enumerate(signatures):
+        match = i
+        if signature is not None:
+            for rep in representatives:
+                if signatures_match(signature, signatures[rep], threshold):
+                    match = rep
+                    break
+            if match == i:
+                representatives.append(i)
+        groups.append(match)
+
+    return groups
+
+
+class RecentHashIndex:
+    """
+    Thread-safe LRU index mapping content digests of recent images to detection
+    results, so byte-identical photos sent in a later request skip inference
+
+    Lookups are exact: a perceptual match is not enough to reuse another
+    request's detections, since a small change to the scene can leave the
+    perceptual hash almost untouched.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_INDEX_SIZE, ttl: float = DEFAULT_INDEX_TTL):
+        """
+        Initialize the index
+
+        Args:
+            max_size: Maximum number of entries kept before the oldest is evicted
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest: Optional[str], params: tuple) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached result for a digest computed with the same detection parameters
+
+        Args:
+            digest: Content digest of the image being looked up
+            params: Detection parameters the result must have been produced with
+
+        Returns:
+            A copy of the cached result, or None on a miss or if the entry expired
+        """
+        if digest is None:
+            return None
+
+        with self._lock:
+            key = (digest, params)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return copy.deepcopy(result)
+
+    def put(self, digest: Optional[str], params: tuple, result: Dict[str, Any]):
+        """Store a copy of a detection result, evicting the oldest entry if full"""
+        if digest is None:
+            return
+
+        with self._lock:
+            key = (digest, params)
+            self._entries[key] = (time.monotonic(), copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,117 @@
+#!/usr/bin/env py
+"""
+YOLO API Load Test
+Opens many concurrent connections against the YOLO API server and reports
+latency, plus the server's thread count while the requests are in flight.
+
+Requires httpx, which is not part of requirements.txt:
+    pip install httpx
+
+The API caches results for byte-identical images, so repeating one image only
+measures cache hits after the first request. Pass several images (they are
+cycled across requests) and/or --bust-cache to keep every request on the
+inference queue.
+
+Usage:
+    python load_test.py --image uploads/a.jpg uploads/b.jpg --connections 300 --bust-cache
+    python load_test.py --url http://127.0.0.1:5000 --connections 300   # /health only
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import httpx
+
+# Base confidence threshold sent with each /predict request
+BASE_CONF_THRESHOLD = 0.7
+
+
+def build_payload(index, image_paths, bust_cache):
+    """Build the /predict body for the index-th request"""
+    payload = {'image_path': image_paths[index % len(image_paths)]}
+    if bust_cache:
+        # Cache entries are keyed on the detection params, so a unique,
+        # negligibly different threshold makes every request a cache miss
+        payload['conf_threshold'] = BASE_CONF_THRESHOLD + index * 1e-9
+    return payload
+
+
+async def send_request(client, url, payload):
+    """Send one request and return (succeeded, latency in seconds)"""
+    start = time.perf_counter()
+    try:
+        if payload:
+            response = await client.post(f"{url}/predict", json=payload)
+            succeeded = response.status_code == 200 and response.json().get('success') is True
+        else:
+            response = await client.get(f"{url}/health")
+            succeeded = response.status_code == 200
+    except httpx.HTTPError:
+        succeeded = False
+    return succeeded, time.perf_counter() - start
+
+
+async def sample_threads(client, url, stop_event, samples):
+    """Poll /health while the load runs and record the reported thread count"""
+    while not stop_event.is_set():
+        try:
+            response = await client.get(f"{url}/health")
+            samples.append(response.json().get('threads'))
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.25)
+
+
+async def run_load_test(url, connections, image_paths, bust_cache):
+    """Fire all requests at once and print a summary"""
+    payloads = [build_payload(i, image_paths, bust_cache) if image_paths else None for i in range(connections)]
+
+    limits = httpx.Limits(max_connections=connections + 1, max_keepalive_connections=connections + 1)
+    async with httpx.AsyncClient(timeout=None, limits=limits) as client:
+        stop_event = asyncio.Event()
+        thread_samples = []
+        sampler = asyncio.create_task(sample_threads(client, url, stop_event, thread_samples))
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(send_request(client, url, payload) for payload in payloads))
+        elapsed = time.perf_counter() - start
+
+        stop_event.set()
+        await sampler
+
+    latencies = sorted(latency for succeeded, latency in results if succeeded)
+    failures = sum(1 for succeeded, _ in results if not succeeded)
+
+    print(f"Target:       {url}/{'predict' if image_paths else 'health'}")
+    print(f"Connections:  {connections}")
+    if image_paths:
+        print(f"Images:       {len(image_paths)}{' (cache busted)' if bust_cache else ''}")
+    print(f"Succeeded:    {len(latencies)}")
+    print(f"Failed:       {failures}")
+    print(f"Wall time:    {elapsed:.2f}s")
+    if latencies:
+        print(f"Latency p50:  {statistics.median(latencies) * 1000:.1f}ms")
+        print(f"Latency p95:  {latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000:.1f}ms")
+        print(f"Latency max:  {latencies[-1] * 1000:.1f}ms")
+
+    thread_counts = [count for count in thread_samples if count is not None]
+    if thread_counts:
+        print(f"Server threads (max while loaded): {max(thread_counts)}")
+    else:
+        print("Server threads: not reported by this server")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the YOLO API server")
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help="Base URL of the YOLO API server")
+    parser.add_argument('--connections', type=int, default=200, help="Number of concurrent requests")
+    parser.add_argument('--image', nargs='+', default=[], help="Image path(s) (as seen by the server) to send to /predict, cycled across requests")
+    parser.add_argument('--bust-cache', action='store_true', help="Vary conf_threshold slightly per request so no request is a result cache hit")
+    args = parser.parse_args()
+
+    asyncio.run(run_load_test(args.url.rstrip('/'), args.connections, args.image, args.bust_cache))
+
+
+if __name__ == "__main__":
+    main()
@@ -241,7 +241,9 @@ app.post('/api/process', async (req, res) => {
                 ...uploadedFilePaths[index],
                 detections: result.detections,
                 detected_classes: result.detected_classes,
-                detection_count: result.detection_count
+                detection_count: result.detection_count,
+                duplicate_of: result.duplicate_of,
+                cached: result.cached
             }));
 
             res.json({
@@ -250,6 +252,7 @@ app.post('/api/process', async (req, res) => {
                 results: results,
                 summary: {
                     total_images: yoloResponse.data.total_images,
+                    unique_images: yoloResponse.data.unique_images,
                     total_detections: yoloResponse.data.total_detections,
                     all_detected_classes: yoloResponse.data.all_detected_classes
                 }
@@ -0,0 +1,168 @@
+"""
+Tests for the perceptual hashing used to collapse duplicate uploads.
+Run with: python -m pytest test_image_hashing.py
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from image_hashing import (
+    dhash,
+    image_digest,
+    image_signature,
+    group_duplicates,
+    RecentHashIndex,
+)
+
+PARAMS = (0.7, 0.3)
+
+
+def make_photo(seed, width=640, height=480):
+    """Build a synthetic 'photo' of soft-edged shapes so re-encodes keep the same structure"""
+    rng = np.random.default_rng(seed)
+    photo = np.zeros((height, width, 3), dtype=np.uint8)
+    for _ in range(25):
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        center = (int(rng.integers(0, width)), int(rng.integers(0, height)))
+        cv2.circle(photo, center, int(rng.integers(20, 150)), color, -1)
+    return cv2.GaussianBlur(photo, (15, 15), 0)
+
+
+def write_image(tmp_path, name, image, params=None):
+    path = str(tmp_path / name)
+    assert cv2.imwrite(path, image, params or [])
+    return path
+
+
+def test_exact_duplicates_share_a_representative(tmp_path):
+    photo = make_photo(1)
+    first = write_image(tmp_path, 'a.png', photo)
+    second = write_image(tmp_path, 'b.png', photo)
+
+    signatures = [image_signature(first), image_signature(second)]
+
+    assert signatures[0] == signatures[1]
+    assert group_duplicates(signatures) == [0, 0]
+
+
+def test_near_duplicates_share_a_representative(tmp_path):
+    photo = make_photo(1)
+    original = write_image(tmp_path, 'a.jpg', photo, [cv2.IMWRITE_JPEG_QUALITY, 95])
+    recompressed = write_image(tmp_path, 'b.jpg', photo, [cv2.IMWRITE_JPEG_QUALITY, 40])
+
+    assert group_duplicates([image_signature(original), image_signature(recompressed)]) == [0, 0]
+
+
+def test_distinct_images_are_kept_apart(tmp_path):
+    paths = [write_image(tmp_path, f'{seed}.png', make_photo(seed)) for seed in (1, 2, 3)]
+
+    assert group_duplicates([image_signature(path) for path in paths]) == [0, 1, 2]
+
+
+def test_resized_copies_are_not_duplicates(tmp_path):
+    photo = make_photo(1)
+    full = write_image(tmp_path, 'full.png', photo)
+    small = write_image(tmp_path, 'small.png', cv2.resize(photo, (320, 240), interpolation=cv2.INTER_AREA))
+
+    full_signature, small_signature = image_signature(full), image_signature(small)
+    assert group_duplicates([full_signature, small_signature]) == [0, 1]
+
+    # Even an identical hash is not enough: the bounding boxes would not line up
+    same_hash = [(full_signature[0], (640, 480)), (full_signature[0], (320, 240))]
+    assert group_duplicates(same_hash) == [0, 1]
+
+
+def test_unhashable_images_are_never_grouped():
+    signature = (0, (10, 10))
+
+    assert group_duplicates([None, None, signature, None]) == [0, 1, 2, 3]
+
+
+def test_unreadable_file_has_no_signature(tmp_path):
+    path = tmp_path / 'broken.jpg'
+    path.write_bytes(b'not an image')
+
+    assert dhash(str(path)) is None
+    assert image_signature(str(path)) is None
+
+
+@pytest.mark.parametrize('width, height', [(900, 6), (6, 900), (1, 1), (3, 3), (7, 7)])
+def test_tiny_images_are_hashed(tmp_path, width, height):
+    image = np.tile(np.arange(width, dtype=np.uint8), (height, 1))
+    path = write_image(tmp_path, 'tiny.png', image)
+
+    signature = image_signature(path)
+
+    assert signature is not None
+    assert signature[1] == (width, height)
+
+
+def test_digest_matches_only_identical_bytes(tmp_path):
+    photo = make_photo(1)
+    first = write_image(tmp_path, 'a.png', photo)
+    second = write_image(tmp_path, 'b.png', photo)
+    recompressed = write_image(tmp_path, 'c.jpg', photo)
+
+    assert image_digest(first) == image_digest(second)
+    assert image_digest(first) != image_digest(recompressed)
+    assert image_digest(str(tmp_path / 'missing.png')) is None
+
+
+def test_index_hits_exact_digest_with_same_params():
+    index = RecentHashIndex()
+    index.put('abc', PARAMS, {'detections': []})
+
+    assert index.get('abc', PARAMS) == {'detections': []}
+
+
+def test_index_misses_on_params_or_digest_mismatch():
+    index = RecentHashIndex()
+    index.put('abc', PARAMS, {'detections': []})
+
+    assert index.get('abc', (0.5, 0.3)) is None
+    assert index.get('abd', PARAMS) is None
+    assert index.get(None, PARAMS) is None
+
+
+def test_index_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('image_hashing.time.monotonic', lambda: now[0])
+    index = RecentHashIndex(ttl=60)
+    index.put('abc', PARAMS, {'detections': []})
+
+    now[0] += 59
+    assert index.get('abc', PARAMS) == {'detections': []}
+
+    now[0] += 2
+    assert index.get('abc', PARAMS) is None
+    assert len(index) == 0
+
+
+def test_index_evicts_least_recently_used():
+    index = RecentHashIndex(max_size=2)
+    index.put('a', PARAMS, {'id': 1})
+    index.put('b', PARAMS, {'id': 2})
+
+    # Touch the first entry so the second becomes the oldest
+    assert index.get('a', PARAMS) == {'id': 1}
+    index.put('c', PARAMS, {'id': 3})
+
+    assert len(index) == 2
+    assert index.get('b', PARAMS) is None
+    assert index.get('a', PARAMS) == {'id': 1}
+    assert index.get('c', PARAMS) == {'id': 3}
+
+
+def test_index_returns_copies():
+    index = RecentHashIndex()
+    result = {'detections': [{'class_name': 'apple'}], 'detected_classes': ['apple']}
+    index.put('abc', PARAMS, result)
+
+    result['detections'].clear()
+    index.get('abc', PARAMS)['detected_classes'].append('banana')
+
+    assert index.get('abc', PARAMS) == {
+        'detections': [{'class_name': 'apple'}],
+        'detected_classes': ['apple'],
+    }
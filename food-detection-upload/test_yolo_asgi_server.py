@@ -0,0 +1,181 @@
+"""
+Tests for the asyncio (ASGI) server: route parity with the Flask server and
+the bounded, pooled inference executor.
+The model is the stand-in from conftest.py.
+Run with: python -m pytest test_yolo_asgi_server.py
+"""
+
+import asyncio
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import yolo_api_server
+import yolo_asgi_server
+from image_hashing import RecentHashIndex
+from yolo_integration import YOLOIntegration
+
+POOL_SIZE = 2
+
+# Fields that legitimately differ between two responses
+VOLATILE_FIELDS = ('timestamp', 'threads')
+
+
+@pytest.fixture
+def asgi(monkeypatch):
+    """The ASGI server module with a fresh executor and an empty model pool"""
+    executor = ThreadPoolExecutor(max_workers=POOL_SIZE)
+    monkeypatch.setattr(yolo_asgi_server, 'inference_executor', executor)
+    monkeypatch.setattr(yolo_asgi_server, 'model_pool', queue.Queue())
+    monkeypatch.setattr(yolo_asgi_server, 'yolo_integration', None)
+    monkeypatch.setattr(yolo_api_server, 'yolo_integration', None)
+    yield yolo_asgi_server
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def loaded(asgi, monkeypatch):
+    """Load models into both servers the way each one does at startup"""
+    hash_index = RecentHashIndex()
+    integrations = [YOLOIntegration('yolo11n.pt', hash_index) for _ in range(POOL_SIZE)]
+    for integration in integrations:
+        asgi.model_pool.put(integration)
+    monkeypatch.setattr(asgi, 'yolo_integration', integrations[0])
+    monkeypatch.setattr(yolo_api_server, 'yolo_integration', YOLOIntegration('yolo11n.pt'))
+    return integrations
+
+
+def call_flask(method, path, body):
+    client = yolo_api_server.app.test_client()
+    response = client.open(path, method=method, json=body)
+    return response.status_code, response.get_json()
+
+
+def call_asgi(method, path, body):
+    async def call():
+        client = yolo_asgi_server.app.test_client()
+        if method == 'GET':
+            response = await client.get(path)
+        else:
+            response = await client.post(path, json=body)
+        return response.status_code, await response.get_json()
+    return asyncio.run(call())
+
+
+def strip_volatile(payload):
+    return {key: value for key, value in payload.items() if key not in VOLATILE_FIELDS}
+
+
+def assert_same_response(method, path, body=None):
+    flask_status, flask_json = call_flask(method, path, body)
+    asgi_status, asgi_json = call_asgi(method, path, body)
+
+    assert asgi_status == flask_status
+    assert strip_volatile(asgi_json) == strip_volatile(flask_json)
+    return asgi_status, asgi_json
+
+
+def test_health_and_index_match_flask(loaded):
+    status, payload = assert_same_response('GET', '/health')
+    assert status == 200
+    assert payload['yolo_loaded'] is True
+    assert 'threads' in payload
+
+    assert assert_same_response('GET', '/')[0] == 200
+
+
+def test_model_info_matches_flask(loaded):
+    status, payload = assert_same_response('GET', '/model_info')
+
+    assert status == 200
+    assert payload['class_names'] == ['apple', 'banana']
+
+
+def test_predict_matches_flask(loaded, sample_images):
+    status, payload = assert_same_response('POST', '/predict', {'image_path': sample_images['a']})
+
+    assert status == 200
+    assert payload['success'] is True
+    assert payload['total_detections'] == 1
+
+
+def test_predict_batch_matches_flask(loaded, sample_images):
+    body = {'image_paths': [sample_images['a'], sample_images['a_copy'], sample_images['b']]}
+
+    status, payload = assert_same_response('POST', '/predict_batch', body)
+
+    assert status == 200
+    assert payload['unique_images'] == 2
+
+
+@pytest.mark.parametrize('path, body, expected_status', [
+    ('/predict', {}, 400),
+    ('/predict', {'image_path': 'missing.jpg'}, 404),
+    ('/predict_batch', {}, 400),
+    ('/predict_batch', {'image_paths': ['missing.jpg']}, 404),
+])
+def test_request_errors_match_flask(loaded, path, body, expected_status):
+    status, payload = assert_same_response('POST', path, body)
+
+    assert status == expected_status
+    assert 'error' in payload
+
+
+def test_unloaded_model_errors_match_flask(asgi, sample_images):
+    assert assert_same_response('GET', '/model_info')[0] == 500
+    assert assert_same_response('POST', '/predict', {'image_path': sample_images['a']})[0] == 500
+    assert assert_same_response('POST', '/predict_batch', {'image_paths': [sample_images['a']]})[0] == 500
+    assert assert_same_response('GET', '/health')[1]['yolo_loaded'] is False
+
+
+def test_run_inference_returns_model_to_pool(asgi, loaded):
+    result = asyncio.run(asgi.run_inference(lambda integration: integration.model_path))
+
+    assert result == 'yolo11n.pt'
+    assert asgi.model_pool.qsize() == POOL_SIZE
+
+
+def test_run_inference_returns_model_to_pool_on_error(asgi, loaded):
+    def fail(integration):
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        asyncio.run(asgi.run_inference(fail))
+
+    assert asgi.model_pool.qsize() == POOL_SIZE
+
+
+def test_concurrent_predictions_use_separate_models(asgi, loaded, write_photo):
+    paths = [write_photo(f'photo{i}', seed=i) for i in range(20)]
+
+    async def predict_all():
+        client = asgi.app.test_client()
+        responses = await asyncio.gather(*(client.post('/predict', json={'image_path': path}) for path in paths))
+        return [(response.status_code, await response.get_json()) for response in responses]
+
+    results = asyncio.run(predict_all())
+
+    assert [status for status, _ in results] == [200] * len(paths)
+    assert all(payload['success'] for _, payload in results)
+    assert asgi.model_pool.qsize() == POOL_SIZE
+    assert sum(len(integration.model.calls) for integration in loaded) == len(paths)
+
+
+def test_startup_loads_one_model_per_worker(asgi, monkeypatch):
+    monkeypatch.setattr(asgi, 'INFERENCE_WORKERS', POOL_SIZE)
+
+    async def start_and_wait():
+        async with asgi.app.test_app():
+            for _ in range(100):
+                if asgi.yolo_integration is not None:
+                    break
+                await asyncio.sleep(0.05)
+
+    asyncio.run(start_and_wait())
+
+    assert asgi.yolo_integration is not None
+    assert asgi.model_pool.qsize() == POOL_SIZE
+    pooled = list(asgi.model_pool.queue)
+    assert pooled[0].hash_index is pooled[1].hash_index
+    assert pooled[0].model is not pooled[1].model
@@ -0,0 +1,105 @@
+"""
+Tests for duplicate collapsing and result caching in YOLOIntegration.
+The model is the stand-in from conftest.py.
+Run with: python -m pytest test_yolo_integration.py
+"""
+
+import pytest
+
+from yolo_integration import YOLOIntegration
+
+
+@pytest.fixture
+def yolo():
+    return YOLOIntegration('yolo11n.pt')
+
+
+def test_batch_runs_inference_once_per_distinct_image(yolo, sample_images):
+    a, a_copy, b = sample_images['a'], sample_images['a_copy'], sample_images['b']
+
+    response = yolo.predict_multiple_images([a, a_copy, b])
+
+    assert yolo.model.calls == [[a, b]]
+    assert response['success'] is True
+    assert response['total_images'] == 3
+    assert response['unique_images'] == 2
+    assert response['total_detections'] == 2
+    assert response['all_detected_classes'] == ['apple']
+
+
+def test_batch_fans_results_out_to_duplicates(yolo, sample_images):
+    a, a_copy, b = sample_images['a'], sample_images['a_copy'], sample_images['b']
+
+    results = yolo.predict_multiple_images([a, a_copy, b])['results']
+
+    assert [result['image_path'] for result in results] == [a, a_copy, b]
+    assert [result['duplicate_of'] for result in results] == [None, a, None]
+    assert [result['cached'] for result in results] == [False, False, False]
+    assert [result['detection_count'] for result in results] == [1, 1, 1]
+    assert results[1]['detections'] == results[0]['detections']
+
+
+def test_batch_results_are_independent_copies(yolo, sample_images):
+    a, a_copy = sample_images['a'], sample_images['a_copy']
+
+    results = yolo.predict_multiple_images([a, a_copy])['results']
+    results[0]['detections'][0]['bbox']['x1'] = -1.0
+    results[0]['detected_classes'].append('banana')
+
+    assert results[1]['detections'][0]['bbox']['x1'] == 1.0
+    assert results[1]['detected_classes'] == ['apple']
+
+    # The cached copy is untouched as well
+    again = yolo.predict_multiple_images([a])['results'][0]
+    assert again['detections'][0]['bbox']['x1'] == 1.0
+    assert again['detected_classes'] == ['apple']
+
+
+def test_second_batch_hits_the_index(yolo, sample_images):
+    a, a_copy, b = sample_images['a'], sample_images['a_copy'], sample_images['b']
+    yolo.predict_multiple_images([a, b])
+
+    response = yolo.predict_multiple_images([a_copy, b])
+
+    assert yolo.model.calls == [[a, b]]
+    assert [result['cached'] for result in response['results']] == [True, True]
+    assert response['total_detections'] == 2
+
+
+def test_batch_with_different_params_misses_the_index(yolo, sample_images):
+    a = sample_images['a']
+    yolo.predict_multiple_images([a], conf_threshold=0.7)
+
+    yolo.predict_multiple_images([a], conf_threshold=0.5)
+
+    assert yolo.model.calls == [[a], [a]]
+
+
+def test_single_image_uses_the_index(yolo, sample_images):
+    a, a_copy = sample_images['a'], sample_images['a_copy']
+
+    first = yolo.predict_image(a)
+    second = yolo.predict_image(a_copy)
+
+    assert yolo.model.calls == [[a]]
+    assert second['success'] is True
+    assert second['image_path'] == a_copy
+    assert second['detections'] == first['detections']
+    assert second['total_detections'] == 1
+
+
+def test_single_image_result_does_not_alias_the_index(yolo, sample_images):
+    a = sample_images['a']
+
+    yolo.predict_image(a)['detections'].clear()
+
+    assert yolo.predict_image(a)['total_detections'] == 1
+
+
+def test_batch_and_single_share_the_index(yolo, sample_images):
+    a, b = sample_images['a'], sample_images['b']
+    yolo.predict_multiple_images([a, b])
+
+    yolo.predict_image(b)
+
+    assert yolo.model.calls == [[a, b]]
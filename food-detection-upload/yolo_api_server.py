@@ -17,7 +17,7 @@ import time
 
 # Add the parent directory to the path to import the YOLO integration
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from yolo_integration import YOLOIntegration
+from yolo_integration import YOLOIntegration, find_model_path
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
@@ -30,18 +30,7 @@ def initialize_yolo():
     global yolo_integration
     try:
         # Try to find the model file
-        model_paths = [
-            './exp2/weights/best.pt',  # The custom trained model
-            '../exp2/weights/best.pt',  # Relative path from food-detection-upload folder
-            '../../runs/train/exp2/weights/best.pt',  # Two levels up
-            'yolo11n.pt'  # Fallback to YOLOv11n. Will be inaccurate or might not work.
-        ]
-        
-        model_path = None
-        for path in model_paths:
-            if os.path.exists(path):
-                model_path = path
-                break
+        model_path = find_model_path()
         
         if model_path:
             print(f"Found model at: {model_path}")
@@ -69,7 +58,8 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'yolo_loaded': yolo_integration is not None,
-        'timestamp': time.time()
+        'timestamp': time.time(),
+        'threads': threading.active_count()
     })
 
 @app.route('/predict', methods=['POST'])
@@ -0,0 +1,185 @@
+#!/usr/bin/env py
+"""
+YOLO ASGI Server
+An asyncio-based (Quart) version of yolo_api_server.py with the same routes.
+Requests are handled on a single event loop; inference runs on a small bounded
+thread pool so slow clients never tie up a thread each.
+
+Run with:
+    python yolo_asgi_server.py
+or:
+    uvicorn yolo_asgi_server:app --host 0.0.0.0 --port 5000
+"""
+
+import os
+import sys
+import json
+import queue
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import aiofiles.os
+from quart import Quart, Response, request, jsonify
+from quart_cors import cors
+
+# Add the parent directory to the path to import the YOLO integration
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from yolo_integration import YOLOIntegration, find_model_path
+from image_hashing import RecentHashIndex
+
+app = Quart(__name__)
+app = cors(app)  # Enable CORS for all routes
+
+# Number of threads allowed to run inference at once. Ultralytics models are not
+# thread-safe, so each worker gets its own model instance from model_pool.
+INFERENCE_WORKERS = max(1, int(os.environ.get('YOLO_INFERENCE_WORKERS', '1')))
+inference_executor = ThreadPoolExecutor(max_workers=INFERENCE_WORKERS, thread_name_prefix='yolo-inference')
+
+# One YOLO integration per inference worker, checked out for the duration of a call
+model_pool = queue.Queue()
+
+# Global YOLO integration instance (the first in the pool, used for status and model info)
+yolo_integration = None
+
+def load_yolo():
+    """Load one YOLO integration per inference worker (blocking, runs on the inference executor)"""
+    global yolo_integration
+    try:
+        model_path = find_model_path()
+
+        if model_path:
+            print(f"Found model at: {model_path}")
+        else:
+            print("No model found, using YOLOv11n as fallback")
+            model_path = 'yolo11n.pt'
+
+        # The instances share one hash index so duplicate caching works across workers
+        hash_index = RecentHashIndex()
+        integrations = [YOLOIntegration(model_path, hash_index) for _ in range(INFERENCE_WORKERS)]
+        for integration in integrations:
+            model_pool.put(integration)
+        yolo_integration = integrations[0]
+
+    except Exception as e:
+        print(f"Error initializing YOLO: {e}")
+        yolo_integration = None
+
+async def run_inference(method, *args):
+    """Run a blocking YOLOIntegration method on the bounded executor with a pooled model"""
+    def call():
+        integration = model_pool.get()
+        try:
+            return method(integration, *args)
+        finally:
+            model_pool.put(integration)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(inference_executor, call)
+
+async def json_response(payload, status=200):
+    """Serialize a (possibly large) payload off the event loop"""
+    loop = asyncio.get_running_loop()
+    body = await loop.run_in_executor(None, json.dumps, payload)
+    return Response(body, status=status, mimetype='application/json')
+
+@app.before_serving
+async def startup():
+    """Start loading the model without blocking the server from accepting requests"""
+    loop = asyncio.get_running_loop()
+    loop.run_in_executor(inference_executor, load_yolo)
+
+@app.after_serving
+async def shutdown():
+    """Stop the inference executor"""
+    inference_executor.shutdown(wait=False)
+
+@app.route('/', methods=['GET'])
+async def index():
+    return jsonify({
+        "status": "running",
+        "message": "YOLO API is active. Use /health, /predict, etc."
+    })
+
+@app.route('/health', methods=['GET'])
+async def health_check():
+    """Health check endpoint"""
+    return jsonify({
+        'status': 'healthy',
+        'yolo_loaded': yolo_integration is not None,
+        'timestamp': time.time(),
+        'threads': threading.active_count()
+    })
+
+@app.route('/predict', methods=['POST'])
+async def predict_single():
+    """Predict on a single image"""
+    try:
+        data = await request.get_json()
+        image_path = data.get('image_path')
+        conf_threshold = data.get('conf_threshold', 0.7)
+        iou_threshold = data.get('iou_threshold', 0.3)
+
+        if not image_path:
+            return jsonify({'error': 'image_path is required'}), 400
+
+        if not await aiofiles.os.path.exists(image_path):
+            return jsonify({'error': f'Image file not found: {image_path}'}), 404
+
+        if yolo_integration is None:
+            return jsonify({'error': 'YOLO model not loaded'}), 500
+
+        result = await run_inference(YOLOIntegration.predict_image, image_path, conf_threshold, iou_threshold)
+        return await json_response(result)
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/predict_batch', methods=['POST'])
+async def predict_batch():
+    """Predict on multiple images"""
+    try:
+        data = await request.get_json()
+        image_paths = data.get('image_paths', [])
+        conf_threshold = data.get('conf_threshold', 0.7)
+        iou_threshold = data.get('iou_threshold', 0.3)
+
+        if not image_paths:
+            return jsonify({'error': 'image_paths is required'}), 400
+
+        # Check if all images exist
+        exists = await asyncio.gather(*(aiofiles.os.path.exists(path) for path in image_paths))
+        missing_images = [path for path, found in zip(image_paths, exists) if not found]
+        if missing_images:
+            return jsonify({'error': f'Images not found: {missing_images}'}), 404
+
+        if yolo_integration is None:
+            return jsonify({'error': 'YOLO model not loaded'}), 500
+
+        result = await run_inference(YOLOIntegration.predict_multiple_images, image_paths, conf_threshold, iou_threshold)
+        return await json_response(result)
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/model_info', methods=['GET'])
+async def model_info():
+    """Get information about the loaded model"""
+    if yolo_integration is None:
+        return jsonify({'error': 'YOLO model not loaded'}), 500
+
+    return jsonify({
+        'model_path': yolo_integration.model_path,
+        'model_loaded': yolo_integration.model is not None,
+        'class_names': list(yolo_integration.model.names.values()) if yolo_integration.model else []
+    })
+
+def run_yolo_asgi_server(port=5000):
+    """Run the YOLO ASGI server"""
+    import uvicorn
+
+    print(f"Starting YOLO ASGI server on port {port}...")
+    uvicorn.run(app, host='0.0.0.0', port=port)
+
+if __name__ == '__main__':
+    run_yolo_asgi_server()
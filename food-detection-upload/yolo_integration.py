@@ -6,6 +6,7 @@ This module provides an API wrapper for the YOLOv11n model to be called from the
 
 import os
 import sys
+import copy
 import json
 import base64
 from pathlib import Path
@@ -13,17 +14,35 @@ from typing import List, Dict, Any
 import cv2
 import numpy as np
 from ultralytics import YOLO
+from image_hashing import image_digest, image_signature, group_duplicates, RecentHashIndex
+
+def find_model_path():
+    """Return the first model weights file that exists, or None"""
+    model_paths = [
+        './exp2/weights/best.pt',  # The custom trained model
+        '../exp2/weights/best.pt',  # Relative path from food-detection-upload folder
+        '../../runs/train/exp2/weights/best.pt',  # Two levels up
+        'yolo11n.pt'  # Fallback to YOLOv11n. Will be inaccurate or might not work.
+    ]
+    
+    for path in model_paths:
+        if os.path.exists(path):
+            return path
+    return None
+
 
 class YOLOIntegration:
-    def __init__(self, model_path: str = None):
+    def __init__(self, model_path: str = None, hash_index: RecentHashIndex = None):
         """
         Initialize the YOLO integration
         
         Args:
             model_path: Path to the YOLO model weights file
+            hash_index: Index of recent image hashes, shared when several instances serve one API
         """
         self.model_path = model_path or 'exp2/weights/best.pt' # runs/train/exp2/weights/best.pt orignal
         self.model = None
+        self.hash_index = hash_index if hash_index is not None else RecentHashIndex()
         self.load_model()
     
     def load_model(self):
@@ -64,50 +83,28 @@ class YOLOIntegration:
             raise RuntimeError("Model not loaded")
         
         try:
-            # Run prediction
-            results = self.model.predict(
-                source=image_path,
-                conf=conf_threshold,
-                iou=iou_threshold,
-                save=False,
-                verbose=False
-            )
-            
-            # Process results
-            result = results[0]
-            detections = []
-            detected_classes = set()
-            
-            if result.boxes is not None:
-                for box in result.boxes:
-                    class_id = int(box.cls)
-                    class_name = self.model.names[class_id]
-                    confidence = float(box.conf)
-                    
-                    # Get bounding box coordinates
-                    x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                    
-                    detection = {
-                        'class_id': class_id,
-                        'class_name': class_name,
-                        'confidence': confidence,
-                        'bbox': {
-                            'x1': float(x1),
-                            'y1': float(y1),
-                            'x2': float(x2),
-                            'y2': float(y2)
-                        }
-                    }
-                    
-                    detections.append(detection)
-                    detected_classes.add(class_name)
+            digest = image_digest(image_path)
+            params = (conf_threshold, iou_threshold)
+            cached = self.hash_index.get(digest, params)
+
+            if cached is None:
+                # Run prediction
+                results = self.model.predict(
+                    source=image_path,
+                    conf=conf_threshold,
+                    iou=iou_threshold,
+                    save=False,
+                    verbose=False
+                )
+                cached = self._process_result(results[0])
+                self.hash_index.put(digest, params, cached)
             
             return {
                 'success': True,
                 'image_path': image_path,
-                'detections': detections,
-                'detected_classes': list(detected_classes),
-                'total_detections': len(detections),
+                'detections': cached['detections'],
+                'detected_classes': cached['detected_classes'],
+                'total_detections': len(cached['detections']),
                 'model_path': self.model_path
             }
             
@@ -134,55 +131,58 @@ class YOLOIntegration:
             raise RuntimeError("Model not loaded")
         
         try:
-            # Run prediction on all images
-            results = self.model.predict(
-                source=image_paths,
-                conf=conf_threshold,
-                iou=iou_threshold,
-                save=False,
-                verbose=False
-            )
+            # Hash every image on a small decode so duplicates of the same size only run once
+            params = (conf_threshold, iou_threshold)
+            signatures = [image_signature(path) for path in image_paths]
+            digests = [image_digest(path) for path in image_paths]
+            groups = group_duplicates(signatures)
+            unique_indices = sorted(set(groups))
+            
+            # Reuse results for identical photos seen in a recent request
+            unique_results = {}
+            cached_indices = set()
+            for i in unique_indices:
+                cached = self.hash_index.get(digests[i], params)
+                if cached is not None:
+                    unique_results[i] = cached
+                    cached_indices.add(i)
+            
+            pending_indices = [i for i in unique_indices if i not in unique_results]
+            if pending_indices:
+                # Run prediction on the remaining distinct images
+                results = self.model.predict(
+                    source=[image_paths[i] for i in pending_indices],
+                    conf=conf_threshold,
+                    iou=iou_threshold,
+                    save=False,
+                    verbose=False
+                )
+                
+                for i, result in zip(pending_indices, results):
+                    unique_results[i] = self._process_result(result)
+                    self.hash_index.put(digests[i], params, unique_results[i])
             
             all_results = []
             all_detected_classes = set()
             total_detections = 0
             
-            for i, result in enumerate(results):
-                image_path = image_paths[i]
-                detections = []
-                detected_classes = set()
-                
-                if result.boxes is not None:
-                    for box in result.boxes:
-                        class_id = int(box.cls)
-                        class_name = self.model.names[class_id]
-                        confidence = float(box.conf)
-                        
-                        # Get bounding box coordinates
-                        x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
-                        
-                        detection = {
-                            'class_id': class_id,
-                            'class_name': class_name,
-                            'confidence': confidence,
-                            'bbox': {
-                                'x1': float(x1),
-                                'y1': float(y1),
-                                'x2': float(x2),
-                                'y2': float(y2)
-                            }
-                        }
-                        
-                        detections.append(detection)
-                        detected_classes.add(class_name)
-                        all_detected_classes.add(class_name)
-                        total_detections += 1
+            for i in unique_indices:
+                all_detected_classes.update(unique_results[i]['detected_classes'])
+                total_detections += len(unique_results[i]['detections'])
+            
+            # Fan the results back out to every uploaded image, duplicates included
+            for i, image_path in enumerate(image_paths):
+                source = groups[i]
+                source_result = copy.deepcopy(unique_results[source])
+                detections = source_result['detections']
                 
                 image_result = {
                     'image_path': image_path,
                     'detections': detections,
-                    'detected_classes': list(detected_classes),
-                    'detection_count': len(detections)
+                    'detected_classes': source_result['detected_classes'],
+                    'detection_count': len(detections),
+                    'duplicate_of': image_paths[source] if source != i else None,
+                    'cached': source in cached_indices
                 }
                 
                 all_results.append(image_result)
@@ -192,6 +192,7 @@ class YOLOIntegration:
                 'results': all_results,
                 'all_detected_classes': list(all_detected_classes),
                 'total_images': len(image_paths),
+                'unique_images': len(unique_indices),
                 'total_detections': total_detections,
                 'model_path': self.model_path
             }
@@ -202,6 +203,48 @@ class YOLOIntegration:
                 'error': str(e),
                 'image_paths': image_paths
             }
+    
+    def _process_result(self, result) -> Dict[str, Any]:
+        """
+        Convert a single YOLO result into detections
+        
+        Args:
+            result: Ultralytics result for one image
+            
+        Returns:
+            Dictionary with the detections and the distinct detected classes
+        """
+        detections = []
+        detected_classes = set()
+        
+        if result.boxes is not None:
+            for box in result.boxes:
+                class_id = int(box.cls)
+                class_name = self.model.names[class_id]
+                confidence = float(box.conf)
+                
+                # Get bounding box coordinates
+                x1, y1, x2, y2 = box.xyxy[0].cpu().numpy()
+                
+                detection = {
+                    'class_id': class_id,
+                    'class_name': class_name,
+                    'confidence': confidence,
+                    'bbox': {
+                        'x1': float(x1),
+                        'y1': float(y1),
+                        'x2': float(x2),
+                        'y2': float(y2)
+                    }
+                }
+                
+                detections.append(detection)
+                detected_classes.add(class_name)
+        
+        return {
+            'detections': detections,
+            'detected_classes': list(detected_classes)
+        }
 
 def main():
     """Main function for testing the integration"""